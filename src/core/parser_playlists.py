@@ -1,41 +1,61 @@
-from typing import Any, Dict, List
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
 
-def _simplify_track(track_json: Dict[str, Any]) -> Dict[str, Any]:
-    return {
-        "id": track_json.get("id"),
-        "title": track_json.get("title"),
-        "duration": track_json.get("duration"),
-        "permalink_url": track_json.get("permalink_url"),
-        "playback_count": track_json.get("playback_count"),
-        "likes_count": track_json.get("likes_count"),
-        "reposts_count": track_json.get("reposts_count"),
-    }
+@dataclass(slots=True)
+class PlaylistRecord:
+    """
+    A parsed playlist/album summary with its simplified tracks.
+    """
+
+    id: Optional[int]
+    kind: Optional[str]
+    title: Optional[str]
+    description: Optional[str]
+    genre: Optional[str]
+    track_count: Optional[int]
+    duration: Optional[int]
+    permalink_url: Optional[str]
+    release_date: Optional[str]
+    user: Dict[str, Any]
+    tracks: List[Dict[str, Any]]
 
-def parse_playlist(playlist_json: Dict[str, Any]) -> Dict[str, Any]:
+def parse_playlist(playlist_json: Dict[str, Any]) -> PlaylistRecord:
     """
     Convert a raw SoundCloud playlist/album JSON into a structured summary.
     """
     user = playlist_json.get("user") or {}
     tracks_raw: List[Dict[str, Any]] = playlist_json.get("tracks") or []
 
-    tracks = [_simplify_track(t) for t in tracks_raw]
+    # Simplified tracks are built inline into a presized list rather than
+    # through a helper call per track.
+    tracks: List[Dict[str, Any]] = [None] * len(tracks_raw)  # type: ignore[list-item]
+    for i, t in enumerate(tracks_raw):
+        tracks[i] = {
+            "id": t.get("id"),
+            "title": t.get("title"),
+            "duration": t.get("duration"),
+            "permalink_url": t.get("permalink_url"),
+            "playback_count": t.get("playback_count"),
+            "likes_count": t.get("likes_count"),
+            "reposts_count": t.get("reposts_count"),
+        }
 
-    return {
-        "id": playlist_json.get("id"),
-        "kind": playlist_json.get("kind"),
-        "title": playlist_json.get("title"),
-        "description": playlist_json.get("description"),
-        "genre": playlist_json.get("genre"),
-        "track_count": playlist_json.get("track_count") or len(tracks),
-        "duration": playlist_json.get("duration"),
-        "permalink_url": playlist_json.get("permalink_url"),
-        "release_date": playlist_json.get("release_date"),
-        "user": {
+    return PlaylistRecord(
+        id=playlist_json.get("id"),
+        kind=playlist_json.get("kind"),
+        title=playlist_json.get("title"),
+        description=playlist_json.get("description"),
+        genre=playlist_json.get("genre"),
+        track_count=playlist_json.get("track_count") or len(tracks),
+        duration=playlist_json.get("duration"),
+        permalink_url=playlist_json.get("permalink_url"),
+        release_date=playlist_json.get("release_date"),
+        user={
             "id": user.get("id"),
             "username": user.get("username") or user.get("permalink"),
             "full_name": user.get("full_name") or user.get("name"),
             "followers_count": user.get("followers_count"),
             "verified": user.get("verified", False),
         },
-        "tracks": tracks,
-    }
\ No newline at end of file
+        tracks=tracks,
+    )
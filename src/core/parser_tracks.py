@@ -1,4 +1,41 @@
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Dict, List, Optional
+
+from core.parser_comments import CommentRecord  # type: ignore
+
+@dataclass(slots=True)
+class TrackRecord:
+    """
+    A parsed track in the structure documented in the README.
+
+    Slotted instead of a dict to keep large search results compact; orjson
+    serializes it natively, in field order.
+    """
+
+    artwork_url: Optional[str]
+    caption: str
+    comment_count: Optional[int]
+    created_at: Optional[str]
+    description: str
+    duration: Optional[int]
+    genre: Optional[str]
+    id: Optional[int]
+    likes_count: Optional[int]
+    permalink_url: Optional[str]
+    playback_count: Optional[int]
+    purchase_url: Optional[str]
+    reposts_count: Optional[int]
+    title: Optional[str]
+    uri: Optional[str]
+    user: Dict[str, Any]
+    comments: List[CommentRecord]
+    media: Dict[str, Any]
+
+# Imported after TrackRecord is defined, since the extension builds TrackRecords.
+try:  # Optional compiled fast path, see _parser_fast.pyx
+    from core._parser_fast import parse_tracks_batch as _parse_tracks_batch_fast  # type: ignore
+except ImportError:  # pragma: no cover - extension not built
+    _parse_tracks_batch_fast = None
 
 def _extract_user(user_json: Dict[str, Any]) -> Dict[str, Any]:
     if not user_json:
@@ -16,8 +53,8 @@ def _extract_user(user_json: Dict[str, Any]) -> Dict[str, Any]:
 
 def parse_track(
     track_json: Dict[str, Any],
-    comments: Optional[List[Dict[str, Any]]] = None,
-) -> Dict[str, Any]:
+    comments: Optional[List[CommentRecord]] = None,
+) -> TrackRecord:
     """
     Convert a raw SoundCloud track JSON into the structured form documented in the README.
     """
@@ -33,29 +70,134 @@ def parse_track(
     if comment_count is None and comments:
         comment_count = len(comments)
 
-    result: Dict[str, Any] = {
-        "artwork_url": artwork_url,
-        "caption": track_json.get("caption") or "",
-        "comment_count": comment_count,
-        "created_at": track_json.get("created_at"),
-        "description": track_json.get("description") or "",
-        "duration": track_json.get("duration"),
-        "genre": track_json.get("genre"),
-        "id": track_json.get("id"),
-        "likes_count": track_json.get("likes_count"),
-        "permalink_url": track_json.get("permalink_url"),
-        "playback_count": track_json.get("playback_count"),
-        "purchase_url": track_json.get("purchase_url") or track_json.get("purchase_title"),
-        "reposts_count": track_json.get("reposts_count"),
-        "title": track_json.get("title"),
-        "uri": track_json.get("uri"),
-        "user": {
+    return TrackRecord(
+        artwork_url=artwork_url,
+        caption=track_json.get("caption") or "",
+        comment_count=comment_count,
+        created_at=track_json.get("created_at"),
+        description=track_json.get("description") or "",
+        duration=track_json.get("duration"),
+        genre=track_json.get("genre"),
+        id=track_json.get("id"),
+        likes_count=track_json.get("likes_count"),
+        permalink_url=track_json.get("permalink_url"),
+        playback_count=track_json.get("playback_count"),
+        purchase_url=track_json.get("purchase_url") or track_json.get("purchase_title"),
+        reposts_count=track_json.get("reposts_count"),
+        title=track_json.get("title"),
+        uri=track_json.get("uri"),
+        user={
             "username": user.get("username"),
             "followers_count": user.get("followers_count"),
             "verified": user.get("verified"),
         },
-        "comments": comments,
-        "media": media,
-    }
+        comments=comments,
+        media=media,
+    )
+
+# Source expressions for TrackRecord fields that are not a plain `r.get(name)`,
+# mirroring parse_track for a track without comments. `r` is the raw track and
+# `u` its user object (or an empty dict).
+_BATCH_FIELD_EXPRS: Dict[str, str] = {
+    "artwork_url": "r.get('artwork_url') or r.get('artwork_url_template')",
+    "caption": "r.get('caption') or ''",
+    "description": "r.get('description') or ''",
+    "purchase_url": "r.get('purchase_url') or r.get('purchase_title')",
+    "user": (
+        "{'username': u.get('username') or u.get('permalink'), "
+        "'followers_count': u.get('followers_count'), "
+        "'verified': u.get('verified', False) if u else None}"
+    ),
+    "comments": "[]",
+    "media": "r.get('media') or {}",
+}
+
+def _make_batch_parser() -> Callable[[List[Dict[str, Any]]], List[TrackRecord]]:
+    """
+    Generate a batch parser specialized to TrackRecord's fields.
+
+    Every field lookup is emitted as literal code in one loop body, so parsing
+    a batch costs no helper calls per track. Fields are taken from the
+    dataclass, so the generated code follows TrackRecord when it changes.
+    """
+    args = [
+        f"                {f.name}={_BATCH_FIELD_EXPRS.get(f.name, f'r.get({f.name!r})')},"
+        for f in fields(TrackRecord)
+    ]
+    source = "\n".join(
+        [
+            "def _batch(rows):",
+            "    out = []",
+            "    append = out.append",
+            "    for r in rows:",
+            "        u = r.get('user') or _EMPTY",
+            "        append(",
+            "            TrackRecord(",
+            *args,
+            "            )",
+            "        )",
+            "    return out",
+        ]
+    )
+    namespace: Dict[str, Any] = {"TrackRecord": TrackRecord, "_EMPTY": {}}
+    exec(compile(source, "<parser_tracks batch>", "exec"), namespace)
+    return namespace["_batch"]
+
+_BATCH = _make_batch_parser()
+
+def parse_tracks_batch(tracks_json: List[Dict[str, Any]]) -> List[TrackRecord]:
+    """
+    Parse many comment-less tracks (e.g. search results) in one call.
+
+    Uses the compiled _parser_fast extension when it has been built, and the
+    generated _BATCH parser otherwise.
+    """
+    if _parse_tracks_batch_fast is not None:
+        return _parse_tracks_batch_fast(list(tracks_json))
+    return _BATCH(tracks_json)
+
+# Scalar TrackRecord fields plus the flattened user summary; the nested
+# comments and media objects have no flat columnar form and are left out.
+_TRACK_COLUMNS = (
+    "artwork_url",
+    "caption",
+    "comment_count",
+    "created_at",
+    "description",
+    "duration",
+    "genre",
+    "id",
+    "likes_count",
+    "permalink_url",
+    "playback_count",
+    "purchase_url",
+    "reposts_count",
+    "title",
+    "uri",
+)
+
+def tracks_to_columns(tracks: List[TrackRecord]) -> Dict[str, List[Any]]:
+    """
+    Convert track records into a column-oriented dict of equal-length lists.
+
+    The layout maps directly onto pyarrow.Table.from_pydict for Parquet output.
+    """
+    n = len(tracks)
+    columns: Dict[str, List[Any]] = {name: [None] * n for name in _TRACK_COLUMNS}
+    user_username: List[Any] = [None] * n
+    user_followers_count: List[Any] = [None] * n
+    user_verified: List[Any] = [None] * n
+
+    column_lists = [(name, columns[name]) for name in _TRACK_COLUMNS]
+    for i, track in enumerate(tracks):
+        for name, column in column_lists:
+            column[i] = getattr(track, name)
+        user = track.user
+        user_username[i] = user.get("username")
+        user_followers_count[i] = user.get("followers_count")
+        user_verified[i] = user.get("verified")
 
-    return result
\ No newline at end of file
+    columns["user_username"] = user_username
+    columns["user_followers_count"] = user_followers_count
+    columns["user_verified"] = user_verified
+    return columns
@@ -1,15 +1,48 @@
-import json
+import asyncio
+import concurrent.futures
+import functools
 import logging
+import math
+import threading
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Coroutine, Dict, List, Optional, Protocol, Tuple, TypeVar
 
-import requests
+import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Transient statuses worth retrying with backoff rather than failing the URL.
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Upper bound on a server-requested Retry-After wait, so one reply cannot
+# hold a worker thread for long.
+_MAX_RETRY_AFTER = 60.0
+# Transport-level retries for failed connects, independent of max_retries.
+_CONNECT_RETRIES = 2
+
 class SoundCloudClientError(Exception):
     """Base exception for SoundCloud client failures."""
 
+class SupportsPagination(Protocol):
+    """
+    Structural type for the paginator the fetch loops drive (see utils.pagination.Paginator).
+    """
+
+    end_page: int
+    max_items: Optional[int]
+    current_page: int
+
+    def can_fetch_next_page(self) -> bool: ...
+
+    def start_new_page(self) -> None: ...
+
+    def register_items(self, count: int) -> None: ...
+
+    def reached_max_items(self) -> bool: ...
+
 @dataclass
 class SoundCloudClient:
     """
@@ -18,55 +51,252 @@ class SoundCloudClient:
     A valid client_id is required for most endpoints. Provide it via:
     - ctor argument client_id, or
     - environment variable SOUNDCLOUD_CLIENT_ID (resolved by caller).
+
+    resolve_url and get_track/get_user/get_playlist are memoized per client.
+    Setting cache_dir additionally persists them on disk (requires the
+    optional diskcache package) for cache_ttl seconds, so repeated runs
+    over the same inputs skip the network. Cached dicts are shared between
+    callers and must be treated as read-only.
+
+    GET requests answered with 429/5xx are retried up to max_retries times
+    with exponential backoff (backoff_factor * 2**attempt seconds), honoring
+    Retry-After (capped at 60 seconds) when the API sends it. Connection
+    failures are retried separately by the transport, a fixed
+    _CONNECT_RETRIES times.
     """
 
     client_id: Optional[str] = None
     base_url: str = "https://api-v2.soundcloud.com"
     timeout: int = 10
     user_agent: str = "SoundCloudScraper/1.0"
+    pool_size: int = 8
+    cache_dir: Optional[str] = None
+    cache_ttl: int = 3600
+    max_retries: int = 5
+    backoff_factor: float = 0.3
 
     def __post_init__(self) -> None:
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
+        # Shared by the sync session and the per-call AsyncClient. Accept-Encoding
+        # is left to httpx, which advertises br alongside gzip whenever the
+        # brotli extra is installed and can therefore decode it.
+        self._http_options: Dict[str, Any] = {
+            "headers": {
                 "User-Agent": self.user_agent,
                 "Accept": "application/json, text/plain, */*",
-            }
-        )
-        if not self.client_id:
+            },
+            "timeout": self.timeout,
+            "follow_redirects": True,
+        }
+        # HTTP/2 multiplexes concurrent requests to api-v2 over a single
+        # connection; the keep-alive pool is sized to the worker count.
+        self._transport_options: Dict[str, Any] = {
+            "http2": True,
+            "limits": httpx.Limits(
+                max_connections=max(32, self.pool_size),
+                max_keepalive_connections=self.pool_size,
+            ),
+            "retries": _CONNECT_RETRIES,
+        }
+        if self.client_id:
+            # client_id never changes per client, so it rides along as a default
+            # query param that httpx merges into every request.
+            self._http_options["params"] = {"client_id": self.client_id}
+        else:
             logger.warning(
                 "No SoundCloud client_id configured. Network calls will fail against "
                 "endpoints that require authentication."
             )
+        self.session = httpx.Client(
+            transport=httpx.HTTPTransport(**self._transport_options),
+            **self._http_options,
+        )
+        # A single AsyncClient, driven by one background event loop (started
+        # lazily by run_async), serves every async page fetch so worker threads
+        # share its connections instead of opening new ones per URL.
+        self.async_session = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(**self._transport_options),
+            **self._http_options,
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        # Joined onto relative API paths in _url on every request.
+        self._base = self.base_url.rstrip("/") + "/"
+
+        self._disk_cache = None
+        if self.cache_dir:
+            try:
+                import diskcache
+
+                self._disk_cache = diskcache.Cache(self.cache_dir)
+            except ImportError:
+                logger.warning("cache_dir is set but diskcache is not installed; using the in-memory cache only.")
+        self._get_memoized = functools.lru_cache(maxsize=1024)(self._get_cached_uncached)
+        # Lookups currently being fetched, so concurrent duplicates share one request.
+        self._inflight: Dict[Tuple[str, Optional[str]], "concurrent.futures.Future[Dict[str, Any]]"] = {}
+        self._inflight_lock = threading.Lock()
 
     # -----------------------
     # Low-level HTTP helpers
     # -----------------------
-    def _ensure_client_id(self) -> str:
+    def run_async(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a client coroutine on the shared event loop and wait for its result.
+
+        Safe to call from several worker threads at once.
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever,
+                    name="soundcloud-client-loop",
+                    daemon=True,
+                ).start()
+            loop = self._loop
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def close(self) -> None:
+        """
+        Close both HTTP sessions, the disk cache and the background event loop, if started.
+        """
+        self.session.close()
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop is not None:
+            asyncio.run_coroutine_threadsafe(self.async_session.aclose(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+
+    def _retry_delay(self, method: str, response: httpx.Response, attempt: int) -> Optional[float]:
+        """
+        Seconds to wait before retrying response, or None if it should not be retried.
+        """
+        if method != "GET" or response.status_code not in _RETRY_STATUSES or attempt >= self.max_retries:
+            return None
+
+        delay = self.backoff_factor * (2 ** attempt)
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                requested = float(retry_after)
+            except ValueError:
+                requested = math.nan  # HTTP-date form; keep the exponential backoff
+            if math.isfinite(requested):
+                delay = min(max(0.0, requested), _MAX_RETRY_AFTER)
+        logger.warning(
+            "SoundCloud API returned %d for %s; retrying in %.1fs (attempt %d/%d)",
+            response.status_code,
+            response.url,
+            delay,
+            attempt + 1,
+            self.max_retries,
+        )
+        return delay
+
+    def _ensure_client_id(self) -> None:
         if not self.client_id:
             raise SoundCloudClientError(
                 "SOUNDCLOUD_CLIENT_ID is not set. Set it via environment variable "
                 "or pass client_id to SoundCloudClient()."
             )
-        return self.client_id
 
     def _request(self, method: str, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        self._ensure_client_id()
         try:
             logger.debug("Requesting %s %s params=%s", method, url, params)
-            response = self.session.request(method, url, params=params, timeout=self.timeout)
+            attempt = 0
+            while True:
+                response = self.session.request(method, url, params=params)
+                delay = self._retry_delay(method, response, attempt)
+                if delay is None:
+                    break
+                time.sleep(delay)
+                attempt += 1
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as exc:
+            return orjson.loads(response.content)
+        except httpx.HTTPError as exc:
             raise SoundCloudClientError(f"HTTP error calling SoundCloud API: {exc}") from exc
-        except json.JSONDecodeError as exc:
+        except orjson.JSONDecodeError as exc:
             raise SoundCloudClientError(f"Failed to parse JSON from SoundCloud API: {exc}") from exc
 
+    async def _arequest(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        self._ensure_client_id()
+        try:
+            logger.debug("Requesting (async) %s %s params=%s", method, url, params)
+            attempt = 0
+            while True:
+                response = await self.async_session.request(method, url, params=params)
+                delay = self._retry_delay(method, response, attempt)
+                if delay is None:
+                    break
+                await asyncio.sleep(delay)
+                attempt += 1
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except httpx.HTTPError as exc:
+            raise SoundCloudClientError(f"HTTP error calling SoundCloud API: {exc}") from exc
+        except orjson.JSONDecodeError as exc:
+            raise SoundCloudClientError(f"Failed to parse JSON from SoundCloud API: {exc}") from exc
+
+    def _url(self, path_or_url: str) -> str:
+        if path_or_url.startswith(("http://", "https://")):
+            return path_or_url
+        if path_or_url[:1] == "/":
+            path_or_url = path_or_url.lstrip("/")
+        return self._base + path_or_url
+
     def _get(self, path_or_url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        if path_or_url.startswith("http://") or path_or_url.startswith("https://"):
-            url = path_or_url
-        else:
-            url = f"{self.base_url.rstrip('/')}/{path_or_url.lstrip('/')}"
-        return self._request("GET", url, params=params)
+        return self._request("GET", self._url(path_or_url), params=params)
+
+    def _get_cached(self, path: str, resource_url: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Memoized GET. Concurrent callers for the same lookup wait on a single request.
+        """
+        key = (path, resource_url)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if future is None:
+                future = self._inflight[key] = concurrent.futures.Future()
+        if not owner:
+            return future.result()
+
+        try:
+            future.set_result(self._get_memoized(path, resource_url))
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+        return future.result()
+
+    def _get_cached_uncached(self, path: str, resource_url: Optional[str] = None) -> Dict[str, Any]:
+        """
+        GET path (with an optional url= param), consulting the disk cache first.
+
+        Wrapped per instance in functools.lru_cache as self._get_memoized.
+        """
+        # The API base is part of the key so clients pointed at different
+        # bases can share one cache_dir.
+        key = f"{self._base}{path}?url={resource_url}" if resource_url else f"{self._base}{path}"
+        if self._disk_cache is not None:
+            data = self._disk_cache.get(key)
+            if data is not None:
+                logger.debug("Disk cache hit for %s", key)
+                return data
+
+        params = {"url": resource_url} if resource_url else None
+        data = self._get(path, params=params)
+        if self._disk_cache is not None:
+            self._disk_cache.set(key, data, expire=self.cache_ttl)
+        return data
 
     # -----------------------
     # High-level API methods
@@ -75,26 +305,18 @@ class SoundCloudClient:
         """
         Resolve any SoundCloud resource URL to a canonical API object.
         """
-        client_id = self._ensure_client_id()
-        params = {"url": resource_url, "client_id": client_id}
-        data = self._get("resolve", params=params)
+        data = self._get_cached("resolve", resource_url)
         logger.debug("Resolved URL %s to kind=%s id=%s", resource_url, data.get("kind"), data.get("id"))
         return data
 
     def get_track(self, track_id: int) -> Dict[str, Any]:
-        client_id = self._ensure_client_id()
-        params = {"client_id": client_id}
-        return self._get(f"tracks/{track_id}", params=params)
+        return self._get_cached(f"tracks/{track_id}")
 
     def get_user(self, user_id: int) -> Dict[str, Any]:
-        client_id = self._ensure_client_id()
-        params = {"client_id": client_id}
-        return self._get(f"users/{user_id}", params=params)
+        return self._get_cached(f"users/{user_id}")
 
     def get_playlist(self, playlist_id: int) -> Dict[str, Any]:
-        client_id = self._ensure_client_id()
-        params = {"client_id": client_id}
-        return self._get(f"playlists/{playlist_id}", params=params)
+        return self._get_cached(f"playlists/{playlist_id}")
 
     def get_comments_page(
         self,
@@ -105,9 +327,7 @@ class SoundCloudClient:
         """
         Retrieve a single page of comments for a track.
         """
-        client_id = self._ensure_client_id()
         params = {
-            "client_id": client_id,
             "limit": limit,
             "offset": offset,
         }
@@ -116,22 +336,22 @@ class SoundCloudClient:
     def get_all_comments_for_track(
         self,
         track_id: int,
-        paginator: "Paginator",
+        paginator: SupportsPagination,
         page_size: int = 200,
     ) -> List[Dict[str, Any]]:
         """
         Fetch comments for a track, honoring paginator.page and paginator.max_items.
         """
-        from utils.pagination import Paginator  # Local import to avoid circular at import time
-
-        if not isinstance(paginator, Paginator):
-            raise SoundCloudClientError("Paginator instance is required to fetch comments.")
+        can_fetch_next_page = paginator.can_fetch_next_page
+        start_new_page = paginator.start_new_page
+        register_items = paginator.register_items
+        reached_max_items = paginator.reached_max_items
 
         comments: List[Dict[str, Any]] = []
         offset = 0
 
-        while paginator.can_fetch_next_page():
-            paginator.start_new_page()
+        while can_fetch_next_page():
+            start_new_page()
             logger.debug(
                 "Fetching comments page %d for track_id=%s offset=%s",
                 paginator.current_page,
@@ -144,7 +364,7 @@ class SoundCloudClient:
             if not items:
                 break
 
-            paginator.register_items(len(items))
+            register_items(len(items))
             comments.extend(items)
             offset += len(items)
 
@@ -152,7 +372,7 @@ class SoundCloudClient:
             if not next_href:
                 break
 
-            if paginator.reached_max_items():
+            if reached_max_items():
                 break
 
         logger.info(
@@ -166,26 +386,24 @@ class SoundCloudClient:
     def search_tracks(
         self,
         query: str,
-        paginator: "Paginator",
+        paginator: SupportsPagination,
         limit_per_page: int = 50,
     ) -> List[Dict[str, Any]]:
         """
         Search SoundCloud tracks by a text query, returning raw track JSON objects.
         """
-        from utils.pagination import Paginator  # Local import to avoid circular at import time
+        can_fetch_next_page = paginator.can_fetch_next_page
+        start_new_page = paginator.start_new_page
+        register_items = paginator.register_items
+        reached_max_items = paginator.reached_max_items
 
-        if not isinstance(paginator, Paginator):
-            raise SoundCloudClientError("Paginator instance is required to search tracks.")
-
-        client_id = self._ensure_client_id()
         results: List[Dict[str, Any]] = []
         offset = 0
 
-        while paginator.can_fetch_next_page():
-            paginator.start_new_page()
+        while can_fetch_next_page():
+            start_new_page()
             params = {
                 "q": query,
-                "client_id": client_id,
                 "limit": limit_per_page,
                 "offset": offset,
             }
@@ -202,7 +420,7 @@ class SoundCloudClient:
             if not collection:
                 break
 
-            paginator.register_items(len(collection))
+            register_items(len(collection))
             results.extend(collection)
             offset += len(collection)
 
@@ -210,7 +428,7 @@ class SoundCloudClient:
             if not next_href:
                 break
 
-            if paginator.reached_max_items():
+            if reached_max_items():
                 break
 
         logger.info(
@@ -219,4 +437,162 @@ class SoundCloudClient:
             len(results),
             paginator.current_page,
         )
-        return results
\ No newline at end of file
+        return results
+
+    # -----------------------
+    # Async pagination
+    # -----------------------
+    async def _agather_pages(
+        self,
+        fetch_page: Callable[[int], Awaitable[Dict[str, Any]]],
+        paginator: SupportsPagination,
+        max_items: Optional[int],
+        page_size: int,
+        items_keys: tuple,
+        batch_size: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch pages until paginator stops, up to batch_size pages at a time.
+
+        Offsets are predicted assuming full pages, which lets a batch be requested
+        concurrently when max_items bounds the run. Pages are applied in order with
+        the same stop conditions as the sequential loops. A short page that still
+        has a next link invalidates the predicted offsets: the rest of its batch is
+        discarded and fetching continues one page at a time from the real offset.
+        Without max_items the page count is unknown, so pages are fetched one by one.
+        """
+        can_fetch_next_page = paginator.can_fetch_next_page
+        start_new_page = paginator.start_new_page
+        register_items = paginator.register_items
+        reached_max_items = paginator.reached_max_items
+
+        if max_items is None:
+            batch_size = 1
+
+        results: List[Dict[str, Any]] = []
+        offset = 0
+        while can_fetch_next_page():
+            count = batch_size
+            if max_items is not None:
+                count = min(count, -(-(max_items - offset) // page_size))
+            if paginator.end_page > 0:
+                count = min(count, paginator.end_page - paginator.current_page)
+            count = max(count, 1)
+
+            tasks = [asyncio.ensure_future(fetch_page(offset + k * page_size)) for k in range(count)]
+            try:
+                pages = await asyncio.gather(*tasks)
+            except BaseException:
+                # gather() leaves the siblings of a failed page running; cancel and
+                # reap them so they neither outlive the call nor log unretrieved errors.
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+            for page in pages:
+                start_new_page()
+                items: List[Dict[str, Any]] = []
+                for key in items_keys:
+                    items = page.get(key) or []
+                    if items:
+                        break
+                if not items:
+                    return results
+
+                register_items(len(items))
+                results.extend(items)
+                offset += len(items)
+
+                if not (page.get("next_href") or page.get("next")):
+                    return results
+                if reached_max_items():
+                    return results
+                if len(items) < page_size:
+                    batch_size = 1
+                    break
+        return results
+
+    async def _aget_comments_page(
+        self,
+        track_id: int,
+        limit: int,
+        offset: int,
+    ) -> Dict[str, Any]:
+        params = {
+            "limit": limit,
+            "offset": offset,
+        }
+        return await self._arequest("GET", self._url(f"tracks/{track_id}/comments"), params=params)
+
+    async def _asearch_tracks_page(
+        self,
+        query: str,
+        limit: int,
+        offset: int,
+    ) -> Dict[str, Any]:
+        params = {
+            "q": query,
+            "limit": limit,
+            "offset": offset,
+        }
+        return await self._arequest("GET", self._url("search/tracks"), params=params)
+
+    async def aget_all_comments_for_track(
+        self,
+        track_id: int,
+        paginator: SupportsPagination,
+        page_size: int = 200,
+        batch_size: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """
+        Async variant of get_all_comments_for_track fetching pages concurrently.
+
+        Pages are only fetched concurrently when paginator.max_items is set, since
+        otherwise the page count is only discoverable by following next_href.
+        Run it through run_async.
+        """
+        comments = await self._agather_pages(
+            lambda offset: self._aget_comments_page(track_id, page_size, offset),
+            paginator,
+            paginator.max_items,
+            page_size,
+            ("collection", "comments"),
+            batch_size,
+        )
+        logger.info(
+            "Fetched %d comments for track_id=%s (pages=%d)",
+            len(comments),
+            track_id,
+            paginator.current_page,
+        )
+        return comments
+
+    async def asearch_tracks(
+        self,
+        query: str,
+        paginator: SupportsPagination,
+        limit_per_page: int = 50,
+        batch_size: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """
+        Async variant of search_tracks fetching pages concurrently.
+
+        Pages are only fetched concurrently when paginator.max_items is set.
+        Run it through run_async.
+        """
+        results = await self._agather_pages(
+            lambda offset: self._asearch_tracks_page(query, limit_per_page, offset),
+            paginator,
+            paginator.max_items,
+            limit_per_page,
+            ("collection",),
+            batch_size,
+        )
+        logger.info(
+            "Search for %r returned %d tracks (pages=%d)",
+            query,
+            len(results),
+            paginator.current_page,
+        )
+        return results
@@ -1,10 +1,12 @@
 import argparse
-import json
+import concurrent.futures
 import logging
 import os
 import pathlib
 import sys
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Tuple
+
+import orjson
 
 # Ensure local src/ modules are importable even when running as a script
 CURRENT_DIR = pathlib.Path(__file__).resolve().parent
@@ -14,9 +16,9 @@ if str(CURRENT_DIR) not in sys.path:
     sys.path.insert(0, str(CURRENT_DIR))
 
 from core.soundcloud_client import SoundCloudClient, SoundCloudClientError  # type: ignore
-from core.parser_tracks import parse_track  # type: ignore
-from core.parser_users import parse_user  # type: ignore
-from core.parser_playlists import parse_playlist  # type: ignore
+from core.parser_tracks import TrackRecord, parse_track, parse_tracks_batch, tracks_to_columns  # type: ignore
+from core.parser_users import UserRecord, parse_user  # type: ignore
+from core.parser_playlists import PlaylistRecord, parse_playlist  # type: ignore
 from core.parser_comments import parse_comments  # type: ignore
 from utils.url_validator import classify_url  # type: ignore
 from utils.pagination import Paginator  # type: ignore
@@ -31,8 +33,8 @@ def setup_logging(level_str: str) -> None:
 def load_json_file(path: pathlib.Path, description: str) -> Dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"{description} file not found at: {path}")
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    with path.open("rb") as f:
+        return orjson.loads(f.read())
 
 def load_settings(path: pathlib.Path) -> Dict[str, Any]:
     defaults: Dict[str, Any] = {
@@ -43,6 +45,10 @@ def load_settings(path: pathlib.Path) -> Dict[str, Any]:
         "end_page": 0,
         "max_items": 0,
         "client_id": None,
+        "concurrency": 8,
+        "cache_dir": None,
+        "cache_ttl": 3600,
+        "max_retries": 5,
     }
     if not path.exists():
         return defaults
@@ -67,7 +73,7 @@ def process_track_url(
     client: SoundCloudClient,
     include_comments: bool,
     paginator: Paginator,
-) -> List[Dict[str, Any]]:
+) -> List[TrackRecord]:
     logging.info("Processing track URL: %s", url)
     resolved = client.resolve_url(url)
     if resolved.get("kind") != "track":
@@ -80,7 +86,11 @@ def process_track_url(
     track_json = client.get_track(track_id)
     comments_raw: List[Dict[str, Any]] = []
     if include_comments:
-        comments_raw = client.get_all_comments_for_track(track_id, paginator)
+        if paginator.max_items is None:
+            # Unbounded: the page count is unknown, so there is nothing to overlap.
+            comments_raw = client.get_all_comments_for_track(track_id, paginator)
+        else:
+            comments_raw = client.run_async(client.aget_all_comments_for_track(track_id, paginator))
 
     comments = parse_comments(comments_raw) if comments_raw else []
     record = parse_track(track_json, comments=comments)
@@ -89,7 +99,7 @@ def process_track_url(
 def process_playlist_url(
     url: str,
     client: SoundCloudClient,
-) -> List[Dict[str, Any]]:
+) -> List[PlaylistRecord]:
     logging.info("Processing playlist/album URL: %s", url)
     resolved = client.resolve_url(url)
     if resolved.get("kind") not in {"playlist", "album"}:
@@ -106,7 +116,7 @@ def process_playlist_url(
 def process_user_url(
     url: str,
     client: SoundCloudClient,
-) -> List[Dict[str, Any]]:
+) -> List[UserRecord]:
     logging.info("Processing user URL: %s", url)
     resolved = client.resolve_url(url)
     if resolved.get("kind") != "user":
@@ -124,16 +134,78 @@ def process_search_url(
     url: str,
     client: SoundCloudClient,
     paginator: Paginator,
-) -> List[Dict[str, Any]]:
+) -> List[TrackRecord]:
     logging.info("Processing search URL: %s", url)
     classification = classify_url(url)
-    search_term = classification.get("search_term")
+    search_term = classification.search_term
     if not search_term:
         logging.warning("No search term could be derived from URL: %s", url)
         return []
 
-    tracks = client.search_tracks(search_term, paginator)
-    return [parse_track(track) for track in tracks]
+    if paginator.max_items is None:
+        tracks = client.search_tracks(search_term, paginator)
+    else:
+        tracks = client.run_async(client.asearch_tracks(search_term, paginator))
+    return parse_tracks_batch(tracks)
+
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+def write_json_stream(batches: Iterable[List[Any]], path: pathlib.Path) -> int:
+    """
+    Write records to a JSON array as they arrive, without holding the whole run in memory.
+
+    Produces the same bytes as dumping the full list with OPT_INDENT_2. A .jsonl or
+    .ndjson path writes one compact record per line instead. Returns the record count.
+    """
+    # Stream into a sibling temp file and swap it in at the end, so an interrupted
+    # or failed run leaves any previous output at path intact.
+    tmp_path = path.with_name(path.name + ".tmp")
+    count = 0
+    try:
+        with tmp_path.open("wb") as f:
+            if path.suffix in {".jsonl", ".ndjson"}:
+                for records in batches:
+                    for record in records:
+                        f.write(orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE))
+                        count += 1
+            else:
+                f.write(b"[")
+                for records in batches:
+                    for record in records:
+                        f.write(b",\n  " if count else b"\n  ")
+                        f.write(orjson.dumps(record, option=_JSON_OPTIONS).replace(b"\n", b"\n  "))
+                        count += 1
+                f.write(b"\n]" if count else b"]")
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return count
+
+def import_pyarrow() -> Tuple[Any, Any]:
+    """
+    Import pyarrow and pyarrow.parquet, failing with an actionable message if missing.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise RuntimeError("Parquet output requires pyarrow. Install it with: pip install pyarrow") from exc
+    return pa, pq
+
+def write_parquet(records: List[Any], path: pathlib.Path) -> int:
+    """
+    Write track records to a Parquet file in columnar form. Returns the row count.
+    """
+    pa, pq = import_pyarrow()
+
+    tracks = [record for record in records if isinstance(record, TrackRecord)]
+    skipped = len(records) - len(tracks)
+    if skipped:
+        logging.warning("Parquet output only holds tracks; skipping %d non-track records.", skipped)
+
+    pq.write_table(pa.Table.from_pydict(tracks_to_columns(tracks)), str(path))
+    return len(tracks)
 
 def main() -> None:
     default_input = ROOT_DIR / "data" / "inputs.sample.json"
@@ -159,7 +231,11 @@ def main() -> None:
         "--output",
         type=str,
         default=str(default_output),
-        help="Path to output JSON file (default: data/sample_output.json)",
+        help=(
+            "Path to output JSON file (default: data/sample_output.json). "
+            "A .jsonl/.ndjson path writes one record per line; a .parquet path "
+            "writes track records as a columnar Parquet file."
+        ),
     )
     args = parser.parse_args()
 
@@ -177,52 +253,71 @@ def main() -> None:
     end_page = int(end_page_raw) if isinstance(end_page_raw, int) else 0
     max_items = int(max_items_raw) if isinstance(max_items_raw, int) and max_items_raw > 0 else None
 
-    paginator = Paginator(end_page=end_page, max_items=max_items)
+    output_path = pathlib.Path(args.output)
+    if output_path.suffix == ".parquet":
+        # Fail before any scraping rather than after all of it.
+        import_pyarrow()
 
     client_id = os.getenv("SOUNDCLOUD_CLIENT_ID") or settings.get("client_id")
     timeout = int(settings.get("request_timeout", 10))
     user_agent = str(settings.get("user_agent", "SoundCloudScraper/1.0"))
+    concurrency = max(1, int(settings.get("concurrency", 8)))
 
     client = SoundCloudClient(
         client_id=client_id,
         timeout=timeout,
         user_agent=user_agent,
+        pool_size=concurrency,
+        cache_dir=settings.get("cache_dir"),
+        cache_ttl=int(settings.get("cache_ttl", 3600)),
+        max_retries=int(settings.get("max_retries", 5)),
     )
 
-    results: List[Dict[str, Any]] = []
     urls: List[str] = inputs["urls"]
 
-    for url in urls:
+    def handle(url: str) -> List[Any]:
+        # Paginator is stateful, so every URL gets its own instance.
+        paginator = Paginator(end_page=end_page, max_items=max_items)
         try:
             classification = classify_url(url)
-            if not classification.get("is_valid"):
+            if not classification.is_valid:
                 logging.warning("Skipping invalid SoundCloud URL: %s", url)
-                continue
+                return []
 
-            resource_type = classification.get("resource_type")
+            resource_type = classification.resource_type
+            # Canonical form lets ?in=... variants share one cached resolve.
+            canonical_url = classification.normalized_url
             if resource_type == "track":
-                results.extend(process_track_url(url, client, include_comments, paginator))
-            elif resource_type in {"playlist", "album"}:
-                results.extend(process_playlist_url(url, client))
-            elif resource_type == "user":
-                results.extend(process_user_url(url, client))
-            elif resource_type == "search":
-                results.extend(process_search_url(url, client, paginator))
-            else:
-                logging.warning("Unknown resource type '%s' for URL: %s", resource_type, url)
+                return process_track_url(canonical_url, client, include_comments, paginator)
+            if resource_type in {"playlist", "album"}:
+                return process_playlist_url(canonical_url, client)
+            if resource_type == "user":
+                return process_user_url(canonical_url, client)
+            if resource_type == "search":
+                return process_search_url(url, client, paginator)
+            logging.warning("Unknown resource type '%s' for URL: %s", resource_type, url)
 
         except SoundCloudClientError as exc:
             logging.error("SoundCloud client error for URL %s: %s", url, exc)
         except Exception as exc:  # pragma: no cover - defensive
             logging.exception("Unexpected error while processing URL %s: %s", url, exc)
+        return []
 
-    output_path = pathlib.Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with output_path.open("w", encoding="utf-8") as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+            # map() yields in input order, keeping the output file deterministic.
+            batches = executor.map(handle, urls)
+            if output_path.suffix == ".parquet":
+                # Columnar output needs every row up front.
+                written = write_parquet([record for records in batches for record in records], output_path)
+            else:
+                written = write_json_stream(batches, output_path)
+    finally:
+        client.close()
 
-    logging.info("Scraping completed. Wrote %d items to %s", len(results), output_path)
+    logging.info("Scraping completed. Wrote %d items to %s", written, output_path)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
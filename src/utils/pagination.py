@@ -1,13 +1,16 @@
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class Paginator:
     """
     Simple paginator to control page-based requests and global max_items.
 
     - end_page <= 0 means unlimited pages.
     - max_items is the global cap for total items; None means unlimited.
+
+    Slotted so the per-page bookkeeping reads fixed slots rather than an
+    instance __dict__.
     """
 
     end_page: int = 0
@@ -1,7 +1,45 @@
-from typing import Any, Dict
-from urllib.parse import parse_qs, urlparse
+import functools
+from typing import NamedTuple, Optional
+from urllib.parse import unquote_plus
 
-def classify_url(url: str) -> Dict[str, Any]:
+try:  # google-re2 is a true DFA engine with a re-compatible API
+    import re2 as _re  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    import re as _re
+
+# One pass over the URL classifies it. Path shapes, most specific first:
+# /search[/...]                        -> search
+# /{user_slug}/sets/{playlist_slug}    -> playlist
+# /{user_slug}/albums/{album_slug}     -> album
+# /{user_slug}/{track_slug}            -> track
+# /{user_slug}                         -> user
+# The pattern avoids lookarounds and backreferences so that it compiles
+# under RE2 as well as the stdlib engine. No part matches a line break, so
+# `$` cannot succeed just before a trailing newline.
+_URL_PATTERN = _re.compile(
+    r"^(?P<base>(?i:http[^:/\r\n]*)://(?i:[^/?#\r\n]*soundcloud\.com[^/?#\r\n]*)"
+    r"(?:"
+    r"/+(?P<search>search)(?:/[^?#\r\n]*)?"
+    r"|/+[^/?#\r\n]+/+(?P<collection>sets|albums)/+[^/?#\r\n]+[^?#\r\n]*"
+    r"|/+[^/?#\r\n]+/+(?P<track>[^/?#\r\n]+)[^?#\r\n]*"
+    r"|/+(?P<user>[^/?#\r\n]+)/*"
+    r"|/*"
+    r"))(?:\?(?P<query>[^#\r\n]*))?(?:#[^\r\n]*)?$"
+)
+_QUERY_TERM_PATTERN = _re.compile(r"(?:^|&)q=([^&]+)")
+
+class Classification(NamedTuple):
+    """
+    Result of classify_url. Immutable, so cached instances can be shared.
+    """
+
+    is_valid: bool
+    resource_type: str
+    normalized_url: str
+    search_term: Optional[str] = None
+
+@functools.lru_cache(maxsize=4096)
+def classify_url(url: str) -> Classification:
     """
     Validate and classify a SoundCloud URL into one of:
     - track
@@ -10,57 +48,35 @@ def classify_url(url: str) -> Dict[str, Any]:
     - user
     - search
     - unknown
-    """
-    parsed = urlparse(url)
-
-    result: Dict[str, Any] = {
-        "is_valid": False,
-        "resource_type": "unknown",
-        "normalized_url": url,
-        "search_term": None,
-    }
 
-    if not parsed.scheme.startswith("http"):
-        return result
+    Results are memoized, since the same URL is classified by main() and
+    again by process_search_url, and batch inputs often repeat URLs.
 
-    host = (parsed.netloc or "").lower()
-    if "soundcloud.com" not in host:
-        return result
+    For non-search URLs, normalized_url drops the query string, fragment and
+    trailing slash, so variants such as `?in=user/sets/x` share one canonical
+    form.
+    """
+    # urlparse tolerated surrounding whitespace; so does the classifier.
+    url = url.strip()
+    match = _URL_PATTERN.match(url)
+    if match is None:
+        return Classification(False, "unknown", url)
 
-    path_parts = [p for p in (parsed.path or "").split("/") if p]
-    query_params = parse_qs(parsed.query or "")
+    query = match.group("query")
+    term_match = _QUERY_TERM_PATTERN.search(query) if query else None
 
     # Detect search URLs
-    if "search" in path_parts or "q" in query_params:
-        q_vals = query_params.get("q") or []
-        search_term = q_vals[0] if q_vals else None
-        result.update(
-            {
-                "is_valid": True,
-                "resource_type": "search",
-                "search_term": search_term,
-            }
-        )
-        return result
+    if match.group("search") or term_match:
+        search_term = unquote_plus(term_match.group(1)) if term_match else None
+        return Classification(True, "search", url, search_term)
 
-    # Patterns:
-    # /{user_slug}/{track_slug}
-    # /{user_slug}/sets/{playlist_slug}
-    # /{user_slug}/albums/{album_slug}
-    # /{user_slug}
-    resource_type = "unknown"
-
-    if len(path_parts) >= 3 and path_parts[1] in {"sets", "albums"}:
-        resource_type = "playlist" if path_parts[1] == "sets" else "album"
-    elif len(path_parts) >= 2:
+    collection = match.group("collection")
+    if collection:
+        resource_type = "playlist" if collection == "sets" else "album"
+    elif match.group("track"):
         resource_type = "track"
-    elif len(path_parts) == 1:
+    elif match.group("user"):
         resource_type = "user"
-
-    result.update(
-        {
-            "is_valid": True,
-            "resource_type": resource_type,
-        }
-    )
-    return result
\ No newline at end of file
+    else:
+        resource_type = "unknown"
+    return Classification(True, resource_type, match.group("base").rstrip("/"))
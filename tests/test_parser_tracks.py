@@ -0,0 +1,32 @@
+import pathlib
+import sys
+
+import pytest
+
+SRC_DIR = pathlib.Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from core.parser_tracks import _BATCH, parse_track, parse_tracks_batch  # type: ignore  # noqa: E402
+
+EDGE_ROWS = [
+    {},
+    {"id": 1, "title": "no user"},
+    {"id": 2, "user": None},
+    {"id": 3, "user": {}},
+    {"id": 4, "user": {"username": "", "permalink": "perma", "followers_count": 7}},
+    {"id": 5, "user": {"username": "name", "verified": True}},
+    {"id": 6, "user": {"permalink": "p", "verified": None}},
+    {"id": 7, "caption": None, "description": None, "media": None},
+    {"id": 8, "caption": "c", "description": "d", "media": {"transcodings": [{"url": "u"}]}},
+    {"id": 9, "artwork_url": None, "artwork_url_template": "tpl"},
+    {"id": 10, "artwork_url": "art", "purchase_url": "", "purchase_title": "buy"},
+    {"id": 11, "comment_count": 0, "playback_count": 5, "likes_count": 0},
+]
+
+@pytest.mark.parametrize("row", EDGE_ROWS)
+def test_generated_batch_parser_matches_parse_track(row: dict) -> None:
+    assert _BATCH([row]) == [parse_track(row)]
+
+def test_parse_tracks_batch_matches_parse_track() -> None:
+    assert parse_tracks_batch(EDGE_ROWS) == [parse_track(row) for row in EDGE_ROWS]
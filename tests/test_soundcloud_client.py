@@ -0,0 +1,181 @@
+import asyncio
+import concurrent.futures
+import pathlib
+import sys
+import threading
+import time
+from typing import Callable, Optional
+
+import httpx
+import pytest
+
+SRC_DIR = pathlib.Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from core.soundcloud_client import SoundCloudClient, SoundCloudClientError  # type: ignore  # noqa: E402
+from utils.pagination import Paginator  # type: ignore  # noqa: E402
+
+def _half_page_search(request: httpx.Request) -> httpx.Response:
+    # Mimics SoundCloud search returning fewer items than `limit` while
+    # still advertising a next page.
+    offset = int(request.url.params["offset"])
+    limit = int(request.url.params["limit"])
+    collection = [{"id": i} for i in range(offset, offset + limit // 2)]
+    return httpx.Response(200, json={"collection": collection, "next_href": "https://next"})
+
+def _mock_client(
+    handler: Callable[[httpx.Request], httpx.Response] = _half_page_search,
+    **kwargs,
+) -> SoundCloudClient:
+    kwargs.setdefault("client_id", "test")
+    client = SoundCloudClient(**kwargs)
+    transport = httpx.MockTransport(handler)
+    client.session = httpx.Client(transport=transport)
+    client.async_session = httpx.AsyncClient(transport=transport)
+    return client
+
+def test_async_search_matches_sequential_on_short_pages() -> None:
+    client = _mock_client()
+    try:
+        sequential = client.search_tracks("dnb", Paginator(max_items=200))
+        concurrent = client.run_async(client.asearch_tracks("dnb", Paginator(max_items=200)))
+    finally:
+        client.close()
+
+    assert [t["id"] for t in sequential] == list(range(200))
+    assert [t["id"] for t in concurrent] == list(range(200))
+
+def test_concurrent_duplicate_lookups_share_one_request() -> None:
+    calls = []
+    lock = threading.Lock()
+
+    def slow_resolve(request: httpx.Request) -> httpx.Response:
+        with lock:
+            calls.append(request.url.params["url"])
+        time.sleep(0.05)
+        return httpx.Response(200, json={"kind": "track", "id": 1})
+
+    client = _mock_client(slow_resolve)
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(client.resolve_url, ["https://soundcloud.com/a/t"] * 8))
+    finally:
+        client.close()
+
+    assert calls == ["https://soundcloud.com/a/t"]
+    assert all(result == {"kind": "track", "id": 1} for result in results)
+
+def test_missing_client_id_fails_before_any_request() -> None:
+    calls = []
+
+    def record(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(401)
+
+    client = _mock_client(record, client_id=None)
+    try:
+        with pytest.raises(SoundCloudClientError, match="SOUNDCLOUD_CLIENT_ID is not set"):
+            client.get_track(1)
+        with pytest.raises(SoundCloudClientError, match="SOUNDCLOUD_CLIENT_ID is not set"):
+            client.run_async(client.asearch_tracks("dnb", Paginator(max_items=10)))
+    finally:
+        client.close()
+
+    assert calls == []
+
+def _scripted(statuses, headers=None):
+    """Handler answering with each status in turn, then 200; records request methods."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        status = statuses[len(calls) - 1] if len(calls) <= len(statuses) else 200
+        return httpx.Response(status, headers=headers or {}, json={"ok": status == 200})
+
+    return handler, calls
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_retry_recovers_after_transient_status(use_async: bool) -> None:
+    handler, calls = _scripted([503, 429])
+    client = _mock_client(handler, backoff_factor=0)
+    try:
+        if use_async:
+            data = client.run_async(client._arequest("GET", client._url("tracks/1")))
+        else:
+            data = client._get("tracks/1")
+    finally:
+        client.close()
+
+    assert data == {"ok": True}
+    assert calls == ["GET"] * 3
+
+def test_retry_budget_stops_after_max_retries() -> None:
+    handler, calls = _scripted([503] * 10)
+    client = _mock_client(handler, backoff_factor=0, max_retries=3)
+    try:
+        with pytest.raises(SoundCloudClientError, match="503"):
+            client._get("tracks/1")
+    finally:
+        client.close()
+
+    assert len(calls) == 4
+
+def test_non_get_requests_are_not_retried() -> None:
+    handler, calls = _scripted([503])
+    client = _mock_client(handler, backoff_factor=0)
+    try:
+        with pytest.raises(SoundCloudClientError, match="503"):
+            client._request("POST", client._url("tracks/1"))
+    finally:
+        client.close()
+
+    assert calls == ["POST"]
+
+@pytest.mark.parametrize(
+    "retry_after,expected",
+    [
+        ("2", 2.0),
+        ("-5", 0.0),
+        ("3600", 60.0),
+        ("inf", 0.4),
+        ("nan", 0.4),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 0.4),
+        (None, 0.4),
+    ],
+)
+def test_retry_after_is_capped_and_falls_back_to_backoff(retry_after: Optional[str], expected: float) -> None:
+    client = _mock_client(backoff_factor=0.1)
+    headers = {"Retry-After": retry_after} if retry_after is not None else {}
+    response = httpx.Response(503, headers=headers, request=httpx.Request("GET", "https://api/tracks/1"))
+    try:
+        assert client._retry_delay("GET", response, attempt=2) == pytest.approx(expected)
+        assert client._retry_delay("GET", response, attempt=client.max_retries) is None
+    finally:
+        client.close()
+
+def test_failed_page_cancels_the_rest_of_its_batch() -> None:
+    started = []
+    finished = []
+
+    async def fetch_page(offset: int):
+        started.append(offset)
+        if offset == 0:
+            raise SoundCloudClientError("boom")
+        await asyncio.sleep(0.5)
+        finished.append(offset)
+        return {"collection": [{"id": offset}]}
+
+    async def run() -> None:
+        with pytest.raises(SoundCloudClientError, match="boom"):
+            await client._agather_pages(fetch_page, Paginator(max_items=40), 40, 10, ("collection",), 4)
+        await asyncio.sleep(0.6)
+
+    client = _mock_client()
+    try:
+        client.run_async(run())
+    finally:
+        client.close()
+
+    assert sorted(started) == [0, 10, 20, 30]
+    assert finished == []
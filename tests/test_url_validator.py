@@ -0,0 +1,74 @@
+import pathlib
+import sys
+
+import pytest
+
+SRC_DIR = pathlib.Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from utils.url_validator import Classification, classify_url  # type: ignore  # noqa: E402
+
+# (url, is_valid, resource_type, normalized_url, search_term), following the
+# rules of the original urlparse-based classifier.
+CASES = [
+    # Resource shapes
+    ("https://soundcloud.com/artist/track", True, "track", "https://soundcloud.com/artist/track", None),
+    ("https://soundcloud.com/artist/sets/mix", True, "playlist", "https://soundcloud.com/artist/sets/mix", None),
+    ("https://soundcloud.com/artist/albums/lp/", True, "album", "https://soundcloud.com/artist/albums/lp", None),
+    ("https://soundcloud.com/artist", True, "user", "https://soundcloud.com/artist", None),
+    ("https://soundcloud.com/artist/", True, "user", "https://soundcloud.com/artist", None),
+    ("https://soundcloud.com/artist/sets", True, "track", "https://soundcloud.com/artist/sets", None),
+    ("https://soundcloud.com/artist/track/extra", True, "track", "https://soundcloud.com/artist/track/extra", None),
+    ("https://soundcloud.com/", True, "unknown", "https://soundcloud.com", None),
+    ("https://m.soundcloud.com/artist/track", True, "track", "https://m.soundcloud.com/artist/track", None),
+    # ?in= and fragments are dropped from the canonical URL
+    (
+        "https://soundcloud.com/artist/track?in=artist/sets/mix",
+        True,
+        "track",
+        "https://soundcloud.com/artist/track",
+        None,
+    ),
+    ("https://soundcloud.com/artist/track#t=1:00", True, "track", "https://soundcloud.com/artist/track", None),
+    # Search
+    (
+        "https://soundcloud.com/search?q=drum+and+bass",
+        True,
+        "search",
+        "https://soundcloud.com/search?q=drum+and+bass",
+        "drum and bass",
+    ),
+    (
+        "https://soundcloud.com/search/sounds?x=1&q=dnb%20mix",
+        True,
+        "search",
+        "https://soundcloud.com/search/sounds?x=1&q=dnb%20mix",
+        "dnb mix",
+    ),
+    ("https://soundcloud.com/search", True, "search", "https://soundcloud.com/search", None),
+    ("https://soundcloud.com/searchers", True, "user", "https://soundcloud.com/searchers", None),
+    # q= in a non-search path still marks a search
+    ("https://soundcloud.com/artist/track?q=abc", True, "search", "https://soundcloud.com/artist/track?q=abc", "abc"),
+    ("https://soundcloud.com/artist/track?q=", True, "track", "https://soundcloud.com/artist/track", None),
+    # ';' is not a query separator
+    ("https://soundcloud.com/search?q=a;b", True, "search", "https://soundcloud.com/search?q=a;b", "a;b"),
+    # Case and surrounding whitespace
+    ("HTTPS://SoundCloud.COM/artist/track", True, "track", "HTTPS://SoundCloud.COM/artist/track", None),
+    (" https://soundcloud.com/artist/track\n", True, "track", "https://soundcloud.com/artist/track", None),
+    # Invalid
+    ("ftp://soundcloud.com/artist/track", False, "unknown", "ftp://soundcloud.com/artist/track", None),
+    ("https://example.com/artist/track", False, "unknown", "https://example.com/artist/track", None),
+    ("soundcloud.com/artist/track", False, "unknown", "soundcloud.com/artist/track", None),
+]
+
+
+@pytest.mark.parametrize("url,is_valid,resource_type,normalized_url,search_term", CASES)
+def test_classify_url(
+    url: str,
+    is_valid: bool,
+    resource_type: str,
+    normalized_url: str,
+    search_term: str,
+) -> None:
+    assert classify_url(url) == Classification(is_valid, resource_type, normalized_url, search_term)